@@ -24,22 +24,39 @@ into one of the following WEAK endings:
 	W10. instructive: "-in"
 """
 
-from termcolor import colored
-from typing import Tuple, Union
-
-import re
+from functools import lru_cache
+from typing import Iterable, List, Tuple, Union
 
 import constants
 import utils
 
+__all__ = ['get_transformation', 'produce_nom_plural_example', 'transform_batch']
+
+
+@lru_cache(maxsize=100_000)
+def _get_transformation_cached(word_lower: str) -> Union[Tuple[str, str, str], None]:
+	"""Pure lookup core of ```get_transformation```, cacheable because it never prints."""
+	final_syllable = utils.get_final_syllable(word_lower)
+	final_syllable_consonants = utils._last_two_consonants(final_syllable)
+	strong_form = final_syllable_consonants[-2:]
+	weak_form = constants.lookup_gradation(*strong_form) if len(strong_form) == 2 else None
+	if weak_form is None and final_syllable_consonants:
+		strong_form = final_syllable_consonants[-1]
+		weak_form = constants.lookup_gradation(strong_form)
+	if weak_form is None:
+		return None
+	cluster_start = final_syllable.rfind(strong_form)
+	transformation = final_syllable[:cluster_start] + weak_form + final_syllable[cluster_start+len(strong_form):]
+	return strong_form, weak_form, transformation
+
 
-def get_transformation(word: str) -> Union[Tuple[str, str, str], None, str]:
+def get_transformation(word: str) -> Union[Tuple[str, str, str], str]:
 	"""
 	Perform consonant gradation from strong to weak forms.
-	
+
 	Returns:
 		If ```word``` has a final syllable whose consonant(s) undergo grandation, then a tuple of the strong form, weak form, and transformed final syllable is returned. If ```word``` does not undergo consonant gradation, then an empty string is returned.
-	
+
 	Examples:
 	>>> word1 = 'Afrikka'
 	>>> get_transformation(word1)
@@ -52,34 +69,55 @@ def get_transformation(word: str) -> Union[Tuple[str, str, str], None, str]:
 	The word "Suomi" either does not undergo consonant gradation or the correct gradation is not currently recognized by this script.
 	''
 	"""
-	final_syllable = utils.get_final_syllable(word)
-	final_syllable_consonants = ''.join([consonant[1] for consonant in utils.get_consonants_and_indices(final_syllable)])
-	try:
-		if final_syllable_consonants[-2:] in constants.STRONG_TO_WEAK_GRAD.keys():
-			target_consonants = final_syllable_consonants[-2:]
-		elif final_syllable_consonants[-1] in constants.STRONG_TO_WEAK_GRAD.keys():
-			target_consonants = final_syllable_consonants[-1]
-		weak_form = constants.STRONG_TO_WEAK_GRAD[target_consonants]
-		transformation = re.sub(target_consonants, weak_form, final_syllable, flags=re.IGNORECASE)
-		return target_consonants, weak_form, transformation
-	except:
+	forms = _get_transformation_cached(word.lower())
+	if forms is None:
+		from termcolor import colored # cold path; keeps termcolor off the library import path
 		print(f'The word {colored(word.upper(), "blue")} either does not undergo consonant gradation or the correct gradation is not currently recognized by this script.')
 		return ''
+	return forms
+
+
+def transform_batch(words: Iterable[str]) -> List[Tuple[str, str, str, str]]:
+	"""
+	Perform consonant gradation for every word in ```words```.
+
+	Batch counterpart to ```get_transformation``` for wordlist processing: each
+	row is (word, strong form, weak form, transformed final syllable), with
+	empty strings for words that do not gradate or do not belong to Wordtype A.
+	Repeated words and case variants hit the cached lookup core.
+	"""
+	rows = []
+	for word in words:
+		try:
+			forms = _get_transformation_cached(word.lower())
+		except ValueError:
+			forms = None
+		rows.append((word,) + (forms if forms is not None else ('', '', '')))
+	return rows
 
 
-def produce_nom_plural_example(word: str) -> Union[str, None]:
+def produce_nom_plural_example(word: str) -> str:
 	"""Give an example of a nominative plural transformation."""
-	preceding_syllables = utils.get_preceding_syllables(word)
-	try:	
-		transformation = get_transformation(word)[2]
-		return preceding_syllables + transformation + 't'
-	except:
+	word_lower = word.lower()
+	try:
+		forms = _get_transformation_cached(word_lower)
+	except ValueError: # not a Wordtype A word, so no gradation applies
+		forms = None
+	if forms is None:
 		return word + 't'
+	# Locate the syllable boundary on the lowered word, then slice the original
+	# so the example keeps the caller's casing.
+	preceding_syllables = word[:len(utils.get_preceding_syllables(word_lower))]
+	return preceding_syllables + forms[2] + 't'
 
 
 if __name__ == '__main__':
+	from termcolor import colored
+
 	print('-' * 89)
 	word = input('Please input a Wordtype A nominal (nom. sing.):\n')
+	word_blue = colored(word.upper(), 'blue')
+	word_disp = f'\033[1m{word_blue}\033[0m'
 	print('')
 	guess_strong = input('Which consonant(s) do you think undergo/es gradation?:\n')
 	print('')
@@ -94,15 +132,15 @@ if __name__ == '__main__':
 			print('Correct!')
 			print('\033[0m')
 			print('')
-			print(f'The word \033[1m{colored(word.upper(), "blue")}\033[0m does not undergo consonant gradation.')
-			print(f'The nominative plural form of {colored(word.upper(), "blue")} is {example}.')
+			print(f'The word {word_disp} does not undergo consonant gradation.')
+			print(f'The nominative plural form of {word_blue} is {example}.')
 		else:
 			print('\033[1m')
 			print('Incorrect!')
 			print('\033[0m')
 			print('')
-			print(f'The word \033[1m{colored(word.upper(), "blue")}\033[0m does not undergo consonant gradation.')
-			# print(f'The nominative plural form of {colored(word.upper(), "blue")} is {example}.')
+			print(f'The word {word_disp} does not undergo consonant gradation.')
+			# print(f'The nominative plural form of {word_blue} is {example}.')
 	else:
 		if forms is not None and len(forms) == 3:
 			strong, weak, transformation = forms
@@ -115,10 +153,10 @@ if __name__ == '__main__':
 				print('\033[0m')
 				print('')
 				if example == word + 't':
-					print(f'The word \033[1m{colored(word.upper(), "blue")}\033[0m does not undergo consonant gradation.')
+					print(f'The word {word_disp} does not undergo consonant gradation.')
 				else:
-					print(f'The word \033[1m{colored(word.upper(), "blue")}\033[0m undergoes the following consonant gradation: {strong} -> \033[1m{colored(weak, "blue")}\033[0m')
-					# print(f'The nominative plural form of {colored(word.upper(), "blue")} is {example}.')				
+					print(f'The word {word_disp} undergoes the following consonant gradation: {strong} -> \033[1m{colored(weak, "blue")}\033[0m')
+					# print(f'The nominative plural form of {word_blue} is {example}.')				
 			elif strong == guess_strong and weak != guess_weak:
 				print('\033[1m')
 				print('Half correct!')
@@ -126,8 +164,8 @@ if __name__ == '__main__':
 				print(f'You guessed the correct STRONG form \033[1m{guess_strong}\033[0m.')
 				print(f'However, you guessed the wrong WEAK form: it is not {guess_weak}, but rather \033[1m{colored(weak, "blue")}\033[0m.')
 				print('')
-				print(f'The word \033[1m{colored(word.upper(), "blue")}\033[0m undergoes the following consonant gradation: {strong} -> \033[1m{colored(weak, "blue")}\033[0m.')
-				# print(f'The nominative plural form of {colored(word.upper(), "blue")} is {example}.')
+				print(f'The word {word_disp} undergoes the following consonant gradation: {strong} -> \033[1m{colored(weak, "blue")}\033[0m.')
+				# print(f'The nominative plural form of {word_blue} is {example}.')
 			elif strong != guess_strong and weak == guess_weak:
 				print('\033[1m')
 				print('Half correct!')
@@ -136,16 +174,16 @@ if __name__ == '__main__':
 				print(f'You guessed the correct WEAK form {guess_weak}.')
 				print(f'However, you guessed the wrong STRONG form: it is not {guess_strong}, but rather \033[1m{strong}\033[0m.')
 				print('')
-				print(f'The word \033[1m{colored(word.upper(), "blue")}\033[0m undergoes the following consonant gradation: {strong} -> \033[1m{colored(weak, "blue")}\033[0m.')
-				# print(f'The nominative plural form of {colored(word.upper(), "blue")} is {example}.')
+				print(f'The word {word_disp} undergoes the following consonant gradation: {strong} -> \033[1m{colored(weak, "blue")}\033[0m.')
+				# print(f'The nominative plural form of {word_blue} is {example}.')
 			else:
 				print(f'Incorrect!')
 				print('')
 				print(f'You guessed the STRONG form {guess_strong} and WEAK form {guess_weak}.')
 				print('')
-				print(f'The word {colored(word.upper(), "blue")} undergoes the following consonant gradation: {strong} -> \033[1m{colored(weak, "blue")}\033[0m.')
-				# print(f'The nominative plural form of {colored(word.upper(), "blue")} is {example}.')
+				print(f'The word {word_blue} undergoes the following consonant gradation: {strong} -> \033[1m{colored(weak, "blue")}\033[0m.')
+				# print(f'The nominative plural form of {word_blue} is {example}.')
 		else:
-			print(f'The word \033[1m{colored(word.upper(), "blue")}\033[0m either does not undergo consonant gradation or its gradation is not recognized by the script at this time.')
+			print(f'The word {word_disp} either does not undergo consonant gradation or its gradation is not recognized by the script at this time.')
 	
 	print('-' * 89)
\ No newline at end of file
@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 # constants.py
 
+from typing import Union
+
 
 FINNISH_VOWELS = 'aäeioöuy'
 
@@ -19,4 +21,21 @@ STRONG_TO_WEAK_GRAD = {
 	'k': '',
 	'p': 'v',
 	't': 'd',
-}
\ No newline at end of file
+}
+
+# Gradation table keyed by the strong form packed into one int
+# (ord(c0) | ord(c1) << 8), so lookups hash a machine int instead of a string.
+_GRAD_PACKED = {
+	(ord(strong[0]) | (ord(strong[1]) << 8) if len(strong) == 2 else ord(strong[0])): weak
+	for strong, weak in STRONG_TO_WEAK_GRAD.items()
+}
+
+
+def lookup_gradation(c1: str, c2: str = '') -> Union[str, None]:
+	"""Return the weak form for the strong consonant(s) ```c1``` (+ ```c2```), or None if the cluster does not gradate. Note that a weak form may be the empty string ('k' -> '')."""
+	# All strong forms pack into ints below 0x10000 built from sub-0x100 code
+	# points; anything higher cannot match and would alias a packed 2-char key
+	# (e.g. ord('灭') == ord('m') | ord('p') << 8).
+	if ord(c1) > 0xFF or (c2 and ord(c2) > 0xFF):
+		return None
+	return _GRAD_PACKED.get(ord(c1) | (ord(c2) << 8) if c2 else ord(c1))
\ No newline at end of file
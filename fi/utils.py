@@ -4,38 +4,85 @@
 
 """Utility functions for subword extractions, etc."""
 
+from functools import lru_cache
 from typing import List, Tuple
 
 import constants
 
+_VOWEL_SET = frozenset(constants.FINNISH_VOWELS)
+_NON_VOWEL_DELETE = str.maketrans('', '', ''.join(chr(codepoint) for codepoint in range(0x300) if chr(codepoint) not in _VOWEL_SET))
+
 
 def get_consonants_and_indices(word: str) -> List[Tuple[int, str]]:
-	"""Identify all consonants in ```word``` and their respective indices."""
-	return [(idx, char) for idx, char in enumerate(word) if char not in constants.FINNISH_VOWELS]
+	"""Identify all consonants in ```word``` and their respective indices. Deprecated: prefer ```_last_two_consonants``` when only the tail is needed."""
+	return [(idx, char) for idx, char in enumerate(word) if char not in _VOWEL_SET]
 
 
 def get_vowels_and_indices(word: str) -> List[Tuple[int, str]]:
-	"""Identify all vowels in ```word``` and their respective indices."""
-	return [(idx, char) for idx, char in enumerate(word) if char in constants.FINNISH_VOWELS]
+	"""Identify all vowels in ```word``` and their respective indices. Deprecated: prefer ```get_vowels_str``` or ```get_last_vowel_index```, which avoid building the pair list."""
+	return [(idx, char) for idx, char in enumerate(word) if char in _VOWEL_SET]
+
+
+def get_last_vowel_index(word: str) -> int:
+	"""Identify the index of the last vowel in ```word```; -1 if ```word``` contains no vowels."""
+	last, _ = _last_two_vowel_indices(word)
+	return last
+
+
+def get_vowels_str(word: str) -> str:
+	"""Extract the vowels of ```word```, in order, as a single string. Expects already-lowercased input so callers normalize case exactly once."""
+	vowels = word.translate(_NON_VOWEL_DELETE)
+	if vowels and not _VOWEL_SET.issuperset(vowels):
+		# Code points >= 0x300 are outside the deletion table and survive the
+		# translate pass; drop them here so only Finnish vowels remain.
+		vowels = ''.join(char for char in vowels if char in _VOWEL_SET)
+	return vowels
 
 
+def _last_two_consonants(word: str) -> str:
+	"""Extract the last (up to) two consonants of ```word``` without materializing the full consonant list."""
+	out = []
+	for char in reversed(word):
+		if char not in _VOWEL_SET:
+			out.append(char)
+			if len(out) == 2:
+				break
+	out.reverse()
+	return ''.join(out)
+
+
+def _last_two_vowel_indices(word: str) -> Tuple[int, int]:
+	"""Locate the last and penultimate vowel indices of ```word``` (-1 if absent) without materializing the full vowel list."""
+	last = penultimate = -1
+	for vowel in constants.FINNISH_VOWELS:
+		idx = word.rfind(vowel)
+		if idx > last:
+			penultimate, last = last, idx
+		elif idx > penultimate:
+			penultimate = idx
+	if last != -1:
+		# A doubled vowel ('aa', 'uu', ...) hides its earlier occurrence from
+		# rfind; rescan the prefix for the final vowel's character.
+		idx = word.rfind(word[last], 0, last)
+		if idx > penultimate:
+			penultimate = idx
+	return last, penultimate
+
+
+@lru_cache(maxsize=100_000)
 def get_final_syllable(word: str) -> str:
 	"""Extract the final syllable of ```word```."""
-	if word[-1] not in constants.WORDTYPE_A_VOWELS:
+	if not word or word[-1] not in constants.WORDTYPE_A_VOWELS:
 		raise ValueError(f'The inputted word "{word}" does not belong to Wordtype A, where vowels must belong to: {constants.WORDTYPE_A_VOWELS}. Please try again with a Wordtype A word.')
-	vowel_map = get_vowels_and_indices(word)
-	try:
-		idx, _ = vowel_map[-2]
-		return ''.join([char for char in word[idx+1:]])
-	except IndexError:
-		if vowel_map[-1][1] != word[-1]:
-			raise ValueError(f'The inputted word "{word}" does not belong to Wordtype A, which ends in one of the following vowels: {constants.WORDTYPE_A_VOWELS}. Please try again with a Wordtype A word.')
+	_, penultimate_vowel_idx = _last_two_vowel_indices(word)
+	if penultimate_vowel_idx == -1:
 		raise ValueError(f'The inputted word "{word}" must have 2 or more syllables. Please try again with a multisyllabic word.')
+	return word[penultimate_vowel_idx+1:]
 
 
+@lru_cache(maxsize=100_000)
 def get_preceding_syllables(word: str) -> str:
-	try:
-		penultimate_vowel_idx = get_vowels_and_indices(word)[-2][0]
-		return word[:penultimate_vowel_idx+1]
-	except KeyError:	
-		raise ValueError(f'The inputted word "{word}" must have 2 or more syllables. Please try again with a multisyllabic word.')
\ No newline at end of file
+	_, penultimate_vowel_idx = _last_two_vowel_indices(word)
+	if penultimate_vowel_idx == -1:
+		raise ValueError(f'The inputted word "{word}" must have 2 or more syllables. Please try again with a multisyllabic word.')
+	return word[:penultimate_vowel_idx+1]
\ No newline at end of file
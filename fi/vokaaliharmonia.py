@@ -13,15 +13,49 @@ Rules for native non-compound Finnish words:
 	5. All vowels of ```word``` in "ÄÖYIE" -> back + neutral
 """
 
-from termcolor import colored
+from functools import lru_cache
+from typing import Iterable, List
 
 import utils
 
+_FRONT_VOWELS = frozenset('aou')
+_BACK_VOWELS = frozenset('äöy')
+_NEUTRAL_VOWELS = frozenset('ie')
+_FRONT_NEUTRAL_VOWELS = _FRONT_VOWELS | _NEUTRAL_VOWELS
+_BACK_NEUTRAL_VOWELS = _BACK_VOWELS | _NEUTRAL_VOWELS
+
+_EXAMPLE_ENDINGS = {
+	'neutral': '-ssä, -vät, -kö',
+	'back': '-ssä, -vät, -kö',
+	'back + neutral': '-ssä, -vät, -kö',
+	'front': '-ssa, -vat, -ko',
+	'front + neutral': '-ssa, -vat, -ko',
+}
+
+
+@lru_cache(maxsize=100_000)
+def _return_vowel_group_cached(word_lower: str) -> str:
+	"""Pure classification core of ```return_vowel_group```; expects an already-lowercased word so case variants share one cache entry."""
+	vowel_set = frozenset(utils.get_vowels_str(word_lower))
+	if not vowel_set:
+		return f'inconclusive: "{word_lower}" does not contain vowels'
+	elif vowel_set <= _NEUTRAL_VOWELS: # Rule 1
+		return 'neutral'
+	elif vowel_set <= _FRONT_VOWELS: # Rule 2
+		return 'front'
+	elif vowel_set <= _FRONT_NEUTRAL_VOWELS: # Rule 3
+		return 'front + neutral'
+	elif vowel_set <= _BACK_VOWELS: # Rule 4
+		return 'back'
+	elif vowel_set <= _BACK_NEUTRAL_VOWELS: # Rule 5
+		return 'back + neutral'
+	return None # violates vowel harmony
+
 
 def return_vowel_group(word: str) -> str:
 	"""
 	Determine the vowel group that preserves vowel harmony for ```word```.
-	
+
 	Note:
 		Assumes that ```word``` is NOT a compound and has native Finnish etymology: a native non-compound word cannot contain vowels from the group {a, o, u} *together* with vowels from the group {ä, ö, y}.
 	
@@ -39,43 +73,37 @@ def return_vowel_group(word: str) -> str:
 	>>> return_vowel_group(word4)
 	'back + neutral'
 	"""
-	vowels = [vowel[1] for vowel in utils.get_vowels_and_indices(word)]
-	if not vowels:
-		return f'inconclusive: "{word}" does not contain vowels'
-	elif all(vowel in 'ie' for vowel in vowels): # Rule 1
-		return 'neutral'
-	elif all(vowel in 'aou' for vowel in vowels): # Rule 2
-		return 'front'
-	elif all(vowel in 'aouie' for vowel in vowels): # Rule 3
-		return 'front + neutral'
-	elif all(vowel in 'äöy' for vowel in vowels): # Rule 4
-		return 'back'
-	elif all(vowel in 'äöyie' for vowel in vowels): # Rule 5
-		return 'back + neutral'
-	else:
-		return None
+	return _return_vowel_group_cached(word.lower())
+
+
+def return_vowel_groups(words: Iterable[str]) -> List[str]:
+	"""
+	Determine the vowel group for every word in ```words```.
+
+	Batch counterpart to ```return_vowel_group``` for wordlist grading: repeated
+	words and case variants hit the scalar function's cache instead of being
+	re-classified.
+	"""
+	return [return_vowel_group(word) for word in words]
 
 
 def give_example_endings(word: str) -> str:
 	"""Provide example endings for ```word```, given its vowel harmony group."""
-	vowel_group = return_vowel_group(word)
-	if vowel_group in ['neutral', 'back', 'back + neutral']:
-		return '-ssä, -vät, -kö'
-	elif vowel_group in ['front', 'front + neutral']:
-		return '-ssa, -vat, -ko'
-	else:
-		return 'unknown'
+	return _EXAMPLE_ENDINGS.get(return_vowel_group(word), 'unknown')
 
 
 if __name__ == '__main__':
+	from termcolor import colored
+
 	print('-' * 89)
 	word = input('Enter a native Finnish, non-compound word:\n')
 	if not word:
 		raise NameError(f'You must provide an input.')
-	
+
+	word_disp = f'\033[1m{colored(word.upper(), "blue")}\033[0m'
 	print('')
 	vowel_group = return_vowel_group(word)
-	print(f'The corresponding vowel group for \033[1m{colored(word.upper(), "blue")}\033[0m: {vowel_group}')
+	print(f'The corresponding vowel group for {word_disp}: {vowel_group}')
 	valid_endings = give_example_endings(word)
 	print(f'Examples of valid endings: {colored(valid_endings, "blue")}')
 	print('-' * 89)
\ No newline at end of file